@@ -1,45 +1,141 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
+from functools import lru_cache
+from typing import Optional
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
+import threading
 
 
 class Settings(BaseSettings):
-    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        frozen=True,
+        validate_assignment=False,
+        extra="ignore",
+    )
     
     google_cloud_project: str
     google_application_credentials: str
     google_maps_api_key: str
-    openweather_api_key: str
-    gemini_api_key: str
-    anthropic_api_key: str
-    openai_api_key: str
-    grok_api_key: str
+
+    # Provider keys are optional, a run only needs the one for its model
+    openweather_api_key: Optional[str] = None
+    gemini_api_key: Optional[str] = None
+    anthropic_api_key: Optional[str] = None
+    openai_api_key: Optional[str] = None
+    grok_api_key: Optional[str] = None
     ollama_api_base: str = "http://localhost:11434"
 
+    # Third-party route APIs used by tools/route_apis.py
+    strava_access_token: Optional[str] = None
+    hiking_project_api_key: Optional[str] = None
+    mapbox_access_token: Optional[str] = None
+
     gemini_model:str
     openai_model:str
     grok_model:str
     mistral_model:str 
     gpt_oss_model:str
+    # Optional faster model for the coordinator, defaults to openai_model
+    coordinator_model: Optional[str] = None
+
+    # Max concurrent Google Maps requests across all tools
+    gmaps_max_concurrency: int = 10
+
+    # Cross-session cache for Maps geocodes/places, bump the version to invalidate it
+    # Defaults to the per-user cache dir rather than the shared /tmp
+    maps_cache_path: str = os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "route_scout", "maps.sqlite3"
+    )
+    maps_cache_version: str = "1"
+
+    # Optional offline gazetteer (python -m tools.gazetteer), checked before Google geocoding
+    gazetteer_path: Optional[str] = None
 
     log_level: str = "INFO"
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """ Load the settings on first use and reuse them afterwards"""
+    return Settings()
+
+
+def __getattr__(name):
+    # Keep `from config import settings` working without parsing .env at import
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Agent and tool code should log with lazy %-style arguments, e.g.
+# logger.debug("path=%s", coords), never f-strings: the message is then only
+# built for records that pass the level filter.
+
+_log_listener = None
+_LOG_BUFFER_CAPACITY = 1000
+_LOG_FLUSH_INTERVAL_S = 1.0
+
+
+def _flush_periodically(handler: logging.Handler, stop: threading.Event):
+    """ Push buffered records to disk at least every _LOG_FLUSH_INTERVAL_S"""
+    while not stop.wait(_LOG_FLUSH_INTERVAL_S):
+        handler.flush()
+
 
 def setup_logging():
-    """ Config for the logging setup"""
+    """ Config for the logging setup
+
+    Records are handed to a queue and written to the log file by a
+    background QueueListener, so logging calls don't block on disk I/O.
+    The listener buffers records in a MemoryHandler that writes them out
+    in bulk (when full, on ERROR, every second and at exit).
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
 
-    log_level_int = getattr(logging,settings.log_level.upper(), logging.INFO)
+    log_level_int = getattr(logging,get_settings().log_level.upper(), logging.INFO)
     LOG_FILE_PATH = 'test_log.log'
 
     if(os.path.exists(LOG_FILE_PATH)):
         print(f"Logging will append to :{LOG_FILE_PATH}")
     else:
         print(f"New file created for logging: {LOG_FILE_PATH}")
-    
-    logging.basicConfig(
-        level=logging.DEBUG,
-        format='%(asctime)s - %(levelname)s - %(module)s - %(funcName)s: %(message)s',
-        filename=LOG_FILE_PATH,
-        filemode='a'
-    )
\ No newline at end of file
+
+    file_handler = logging.FileHandler(LOG_FILE_PATH, mode='a')
+    file_handler.setFormatter(logging.Formatter(
+        '%(asctime)s - %(levelname)s - %(module)s - %(funcName)s: %(message)s'
+    ))
+
+    memory_handler = logging.handlers.MemoryHandler(
+        capacity=_LOG_BUFFER_CAPACITY,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+        flushOnClose=True,
+    )
+
+    log_queue = queue.Queue(-1)
+    _log_listener = logging.handlers.QueueListener(log_queue, memory_handler, respect_handler_level=True)
+    _log_listener.start()
+
+    stop_flushing = threading.Event()
+    threading.Thread(
+        target=_flush_periodically,
+        args=(memory_handler, stop_flushing),
+        name="log-flush",
+        daemon=True,
+    ).start()
+
+    def _stop_logging():
+        _log_listener.stop()
+        stop_flushing.set()
+        memory_handler.close()
+
+    atexit.register(_stop_logging)
+
+    root = logging.getLogger()
+    root.setLevel(log_level_int)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
@@ -1,2 +1,33 @@
+import os
+import sys
+
+_INITIALIZED = False
+
+
+def _initialize():
+    """One-time process setup shared by every entry point: path, .env and logging."""
+    global _INITIALIZED
+    if _INITIALIZED:
+        return
+
+    # The repo root holds config.py and the shared tools package
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if repo_root not in sys.path:
+        sys.path.insert(0, repo_root)
+
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    import config
+    config.setup_logging()
+
+    from tools._http import warm_connections
+    warm_connections()
+
+    _INITIALIZED = True
+
+
+_initialize()
+
 from . import agent
 from .agent import route_coordinator as root_agent
@@ -0,0 +1,25 @@
+"""Shared LiteLlm model instances for the route scout agents."""
+
+from functools import lru_cache
+from google.adk.models.lite_llm import LiteLlm
+from config import get_settings
+
+# Model the sub-agents run on, read once at import
+SUB_AGENT_MODEL = get_settings().openai_model
+
+
+@lru_cache(maxsize=4)
+def get_llm(model_name: str) -> LiteLlm:
+    """
+    Get the LiteLlm client for a model name.
+
+    Agents on the same model share one instance instead of each building
+    its own client.
+
+    Args:
+        model_name: LiteLLM model string, e.g. "openai/gpt-4.1"
+
+    Returns:
+        LiteLlm: Model instance for the agent's model field
+    """
+    return LiteLlm(model=model_name)
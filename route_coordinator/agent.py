@@ -1,20 +1,14 @@
-import os
+from functools import lru_cache
 from google.adk.agents import LlmAgent, SequentialAgent, ParallelAgent
 from google.adk.tools.agent_tool import AgentTool
-from google.adk.planners import PlanReActPlanner
-from dotenv import load_dotenv
-from google.adk.models.lite_llm import LiteLlm
+from ._models import SUB_AGENT_MODEL, get_llm
 from . import sub_agents
 from . import prompt
+from config import get_settings
 import logging
-import config
-
-config.setup_logging()
 
 logger = logging.getLogger(__name__)
 
-load_dotenv()
-
 AGENT_NAME="route_coordinator"
 
 location_scout = sub_agents.location_scout.location_scout
@@ -23,18 +17,66 @@ elevation_analyst = sub_agents.elevation_analyst.elevation_analyst
 
 
 
+# Only the elevation analysis depends on another agent (route_builder's
+# route_coordinates), so location scouting runs alongside route building.
+route_analysis = SequentialAgent(
+    name="route_analysis",
+    sub_agents=[route_builder, elevation_analyst],
+    description="Plots a running route and then analyses its elevation",
+)
+
+route_research = ParallelAgent(
+    name="route_research",
+    sub_agents=[location_scout, route_analysis],
+    description="Scouts a given location while plotting a running route and analysing its elevation",
+)
+
+# AgentTool returns only the last event of the workflow, which under a
+# ParallelAgent is whichever branch finished last, so a summary step reads
+# every branch's output_key from state and returns them in one reply
+route_summary = LlmAgent(
+    name="route_summary",
+    model=get_llm(SUB_AGENT_MODEL),
+    description="Merges the location, route and elevation results into one report",
+    instruction=prompt.ROUTE_SUMMARY_PROMPT,
+    include_contents="none",
+    output_key="route_summary",
+)
+
 workflow = SequentialAgent(
     name="route_workflow",
-    sub_agents=[location_scout, route_builder, elevation_analyst],
-    description="A workflow that scoutes a given location, then plots a running route and after that analises its elevation",
+    sub_agents=[route_research, route_summary],
+    description="A workflow that scouts a given location while plotting a running route and analysing its elevation",
 )
 
 
+@lru_cache(maxsize=4)
+def build_coordinator(model_name: str) -> LlmAgent:
+    """
+    Build the coordinator agent for a LiteLLM model name.
+
+    Only the requested model's LiteLlm client is constructed (shared with
+    the sub-agents when they use the same model), and each model's
+    coordinator is built once and reused.
+
+    Args:
+        model_name: LiteLLM model string, e.g. "openai/gpt-4.1"
+
+    Returns:
+        LlmAgent: Coordinator that dispatches the route workflow
+    """
+    logger.info("Building coordinator for model %s", model_name)
+    return LlmAgent(
+        name=AGENT_NAME,
+        model=get_llm(model_name),
+        tools=[AgentTool(agent=workflow)],
+        description="Coordinates running route scouting.",
+        instruction=prompt.ROUTE_COORDINATOR_PROMPT,
+    )
+
 
-route_coordinator = LlmAgent(
-    name=AGENT_NAME,
-    model=LiteLlm(model=os.getenv("OPENAI_MODEL","GROK_MODEL")),
-    tools=[AgentTool(agent=workflow)],
-    description="Coordinates running route scouting.",
-    instruction=prompt.ROUTE_COORDINATOR_PROMPT,
+# The coordinator only dispatches the workflow and fills in the template, so it
+# can run on a faster non-reasoning model than the sub-agents
+route_coordinator = build_coordinator(
+    get_settings().coordinator_model or SUB_AGENT_MODEL
 )
\ No newline at end of file
@@ -1,50 +1,115 @@
 """Main entry point for the Route Scout Agent."""
 
-import sys
-import os
+import asyncio
 import logging
+import sys
+from google.adk.agents.run_config import RunConfig, StreamingMode
+from google.adk.runners import InMemoryRunner
+from google.genai import types
+from . import root_agent
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from google.adk.sessions import Session
-from .agent import root_agent
-import config
-config.setup_logging()
+logger = logging.getLogger(__name__)
 
+APP_NAME = "route_scout"
+USER_ID = "runner"
 
-logger = logging.getLogger(__name__)
+# Stream the coordinator's answer as it is generated instead of waiting for
+# the whole response
+RUN_CONFIG = RunConfig(streaming_mode=StreamingMode.SSE)
+
+BANNER = (
+    "🏃 Route Scout Agent\n"
+    f"{'=' * 50}\n"
+    "Find running routes with distance, elevation, and amenities\n"
+    "Example: 'Find me a scenic 5k in Galway City'\n"
+    f"{'=' * 50}\n"
+    "\n"
+)
+
+
+async def _stream_reply(runner: InMemoryRunner, session_id: str, query: str):
+    """Send one user message and print the coordinator's reply as it streams."""
+    message = types.Content(role="user", parts=[types.Part(text=query)])
+    streamed = False
+
+    async for event in runner.run_async(
+        user_id=USER_ID,
+        session_id=session_id,
+        new_message=message,
+        run_config=RUN_CONFIG,
+    ):
+        if not event.content or not event.content.parts:
+            continue
+        text = "".join(part.text or "" for part in event.content.parts)
+        if event.partial:
+            # Token chunks as they arrive
+            print(text, end="", flush=True)
+            streamed = streamed or bool(text)
+        elif event.is_final_response() and not streamed:
+            # Model didn't stream, print the complete reply
+            print(text)
+        elif event.is_final_response():
+            print()
+
+
+def _close_loop(loop: asyncio.AbstractEventLoop):
+    """Cancel whatever an interrupted turn left running, then close the loop."""
+    pending = asyncio.all_tasks(loop)
+    for task in pending:
+        task.cancel()
+    if pending:
+        loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+    loop.run_until_complete(loop.shutdown_asyncgens())
+    # close() doesn't wait on the default executor, so a tool request still
+    # running in a worker thread can't keep the CLI from exiting
+    loop.close()
+
+
+def _run_session(loop: asyncio.AbstractEventLoop):
+    """Read user requests and stream replies until EOF or 'quit'."""
+    runner = InMemoryRunner(agent=root_agent, app_name=APP_NAME)
+    session = loop.run_until_complete(
+        runner.session_service.create_session(app_name=APP_NAME, user_id=USER_ID)
+    )
+
+    while True:
+        # Prompt on the main thread between turns, so Ctrl-C at the prompt
+        # raises KeyboardInterrupt here instead of blocking a worker thread
+        query = input("You: ").strip()
+        if query.lower() in ("quit", "exit"):
+            break
+        if query:
+            loop.run_until_complete(_stream_reply(runner, session.id, query))
 
 
 def main():
     """Run the route scout agent interactively."""
-    logger.info("=" * 60)
-    logger.info("Starting Route Scout Agent (Interactive Mode)")
-    logger.info("=" * 60)
-
-    print("🏃 Route Scout Agent")
-    print("=" * 50)
-    print("Find running routes with distance, elevation, and amenities")
-    print("Example: 'Find me a scenic 5k in Galway City'")
-    print("=" * 50)
-    print()
+    # Emoji output must not depend on the terminal's locale, and line
+    # buffering flushes once per line rather than on every write
+    sys.stdout.reconfigure(encoding="utf-8", line_buffering=True)
 
-    try:
-        logger.info("Creating agent session")
-        session = Session(agent=root_agent)
+    logger.debug("Starting Route Scout Agent (Interactive Mode)")
 
-        logger.info("Starting interactive session")
-        session.run()
+    sys.stdout.write(BANNER)
 
-        logger.info("Session ended")
+    # One loop for the whole session, the runner and model clients are
+    # reused across turns
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        _run_session(loop)
+        logger.debug("Session ended")
 
-    except KeyboardInterrupt:
-        logger.info("Session interrupted by user")
+    except (KeyboardInterrupt, EOFError):
+        logger.debug("Session interrupted by user")
         print("\nGoodbye!")
     except Exception as e:
-        logger.error(f"Error running agent session: {str(e)}", exc_info=True)
+        logger.error("Error running agent session: %s", e, exc_info=True)
         print(f"\nError: {str(e)}")
         raise
+    finally:
+        _close_loop(loop)
 
 
 if __name__ == "__main__":
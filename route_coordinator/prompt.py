@@ -1,44 +1,69 @@
 """Prompt template for the Route Synthesizer agent."""
 
 ROUTE_COORDINATOR_PROMPT = """
-You are coordinating a route scouting workflow. Your final output MUST include a Google Maps link to the route.
+You coordinate a running route scouting workflow.
 
-CRITICAL REQUIREMENTS:
-1. You MUST ensure the route_builder agent generates a Google Maps URL
-2. The Google Maps URL is MANDATORY - do not complete the task without it
-3. Verify the Google Maps link is valid and included in your final response
+Steps:
+1. Call route_workflow ONCE with the user's location, distance and route type (it scouts the location while building the route, then analyses its elevation)
+2. Take the google_maps_url from the workflow's route summary
+3. If there is no google_maps_url, call route_workflow ONE more time; if it is still missing, say the route could not be built
+4. Fill in the template below with data from the workflow only, the google_maps_url is mandatory
 
-Format your response EXACTLY as follows:
+Template:
 
 🏃 [ROUTE_TYPE] [DISTANCE] in [LOCATION]
 
 📍 **Route Details**
-   • Starting Point: [Location] ([Coordinates])
-   • Distance: [X.X km]
-   • Route Type: [Loop/Out-and-back/Point-to-point]
+• Starting Point: [Location] ([Coordinates])
+• Distance: [X.X km]
+• Route Type: [Loop/Out-and-back/Point-to-point]
 
 ⛰️ **Terrain Profile**
-   • Elevation Gain: [X]m | Difficulty: [Easy/Moderate/Challenging]
-   • [Terrain description]
-   • Best For: [Training types]
+• Elevation Gain: [X]m | Difficulty: [Easy/Moderate/Challenging]
+• [Terrain description]
+• Best For: [Training types]
 
 ⏱️ **Estimated Times**
-   • Easy (6:30/km): [X] min
-   • Moderate (5:30/km): [X] min
-   • Fast (4:30/km): [X] min
+• Easy (6:30/km): [X] min
+• Moderate (5:30/km): [X] min
+• Fast (4:30/km): [X] min
 
-🗺️ **View Route**: [Google Maps URL - THIS IS REQUIRED]
+🗺️ **View Route**: [google_maps_url]
 
 🚻 **Amenities & Features**
-   • Restrooms: [Count/distance]
-   • Water/Cafes: [Count/distance]
-   • Parks: [Names/features]
-   • [Other features]
+• Restrooms: [Count/distance]
+• Water/Cafes: [Count/distance]
+• Parks: [Names/features]
+• [Other features]
 
 💡 **Recommendations**
-   • Best for: [Runner type/training goal]
-   • Best time: [Optimal conditions]
-   • Tips: [Considerations/tips]
+• Best for: [Runner type/training goal]
+• Best time: [Optimal conditions]
+• Tips: [Considerations/tips]
+"""
 
-IMPORTANT: Do not return a response without a valid Google Maps URL in the "View Route" section.
-   """
\ No newline at end of file
+
+# Final step of route_workflow. AgentTool only hands back the last agent's
+# reply, so this merges every branch's saved output (the output_key of each
+# sub-agent) into that reply. Optional keys ('?') render empty when a
+# branch produced nothing.
+ROUTE_SUMMARY_PROMPT = """
+You merge the results of a running route scouting workflow into one report.
+
+Location scouting:
+{location_scouting?}
+
+Route:
+{route_builder_response?}
+
+Google Maps URL: {google_maps_url?}
+
+Elevation analysis:
+{elevation_analysis_response?}
+
+Report, using only the data above:
+- Location: name, coordinates, starting points
+- Route: type, distance, estimated times and the google_maps_url exactly as given (say "google_maps_url: missing" if there is none)
+- Elevation: gain, difficulty, terrain and training benefit
+- Amenities: restrooms, water/cafes and parks with counts and distances
+"""
@@ -1,10 +1,12 @@
 from google.adk.agents import Agent
 from google.adk.tools import ToolContext
-from google.adk.models.lite_llm import LiteLlm
 from typing import Dict, List
+import asyncio
+import bisect
+from tools._geo import cum_haversine
+from ..._models import SUB_AGENT_MODEL, get_llm
 from . import prompt
 from . import tools
-import os
 import logging
 
 
@@ -12,7 +14,19 @@ logger = logging.getLogger(__name__)
 
 AGENT_NAME="elevation_analyst"
 
-def analyze_elevation_for_runners(
+# Cap on concurrent Elevation API requests, keeps batches under Google's QPS
+_MAX_CONCURRENT_ELEVATION_REQUESTS = 10
+
+# Elevation gain (m) upper bounds for each difficulty tier below
+_GAIN_THRESHOLDS = (50, 150, 300)
+_DIFFICULTY_TABLE = (
+    ("Flat - Great for speed work", "Perfect for tempo runs and interval training"),
+    ("Rolling - Moderate hills", "Good for building leg strength and endurance"),
+    ("Hilly - Challenging", "Excellent hill training, builds power and stamina"),
+    ("Very Hilly - Advanced", "Serious hill work, great for race prep and strength"),
+)
+
+async def analyze_elevation_for_runners(
     path_coordinates: List[List[float]],
     samples: int,
     tool_context: ToolContext
@@ -28,34 +42,65 @@ def analyze_elevation_for_runners(
         dict: Elevation analysis with training insights for runners
     """
     logger.info("analyze_elevation_for_runners tool used")
+    return await _analyze_path(path_coordinates, samples)
+
+
+async def analyze_multiple_routes(
+    paths: List[List[List[float]]],
+    samples: int,
+    tool_context: ToolContext
+) -> Dict:
+    """
+    Analyze elevation profiles for several candidate routes at once.
+
+    The Elevation API requests run concurrently, at most
+    _MAX_CONCURRENT_ELEVATION_REQUESTS at a time.
+
+    Args:
+        paths: One list of [lat, lng] coordinate pairs per route
+        samples: Number of elevation samples per route
+
+    Returns:
+        dict: Elevation analysis for each route, in the order given
+    """
+    logger.info("analyze_multiple_routes tool used")
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_ELEVATION_REQUESTS)
+
+    async def analyze(path_coordinates: List[List[float]]) -> Dict:
+        async with semaphore:
+            return await _analyze_path(path_coordinates, samples)
+
+    results = await asyncio.gather(*[analyze(path) for path in paths])
+
+    return {
+        "status": "success",
+        "routes": results,
+        "count": len(results)
+    }
+
+
+async def _analyze_path(path_coordinates: List[List[float]], samples: int) -> Dict:
+    """Fetch one path's elevation profile and add the runner metrics."""
+    # Long Directions paths carry far more points than the profile needs,
+    # stride them down to ~samples points (keeping the end point) before the API call
+    step = max(1, len(path_coordinates) // samples) if samples > 0 else 1
+    if step > 1:
+        path_coordinates = path_coordinates[:-1:step] + path_coordinates[-1:]
+
     # Convert to tuples for the API
-    path_tuples = [(coord[0], coord[1]) for coord in path_coordinates]
+    path_tuples = list(map(tuple, path_coordinates))
     
-    result = tools.get_elevation_along_path(path_tuples, samples)
+    result = await tools.get_elevation_along_path_async(path_tuples, samples)
     
     if result['status'] == 'success':
         gain = result['total_elevation_gain']
 
         # Runner-specific difficulty assessment
-        if gain < 50:
-            difficulty = "Flat - Great for speed work"
-            training_benefit = "Perfect for tempo runs and interval training"
-        elif gain < 150:
-            difficulty = "Rolling - Moderate hills"
-            training_benefit = "Good for building leg strength and endurance"
-        elif gain < 300:
-            difficulty = "Hilly - Challenging"
-            training_benefit = "Excellent hill training, builds power and stamina"
-        else:
-            difficulty = "Very Hilly - Advanced"
-            training_benefit = "Serious hill work, great for race prep and strength"
+        difficulty, training_benefit = _DIFFICULTY_TABLE[bisect.bisect_right(_GAIN_THRESHOLDS, gain)]
         
         # Calculate average grade
-        total_distance_m = sum([
-            ((result['elevation_profile'][i]['lat'] - result['elevation_profile'][i-1]['lat'])**2 +
-             (result['elevation_profile'][i]['lng'] - result['elevation_profile'][i-1]['lng'])**2)**0.5 * 111000
-            for i in range(1, len(result['elevation_profile']))
-        ])
+        profile = result['elevation_profile']
+        total_distance_m = float(cum_haversine(profile['lats'], profile['lngs'])[-1])
         avg_grade = (gain / total_distance_m * 100) if total_distance_m > 0 else 0
         
         result['difficulty_rating'] = difficulty
@@ -71,7 +116,7 @@ def analyze_elevation_for_runners(
 
 elevation_analyst = Agent(
     name=AGENT_NAME,
-    model=LiteLlm(model=os.getenv("OPENAI_MODEL","GROK_MODEL")),
+    model=get_llm(SUB_AGENT_MODEL),
     description=(
         "Analyzes elevation profiles and terrain for running routes." 
         "Specializes in identifying flat routes, hills, and elevation"
@@ -79,5 +124,5 @@ elevation_analyst = Agent(
     ),
     instruction=prompt.ELEVATION_ANALYST_PROMPT,
     output_key="elevation_analysis_response",
-    tools=[analyze_elevation_for_runners]
+    tools=[analyze_elevation_for_runners, analyze_multiple_routes]
 )
\ No newline at end of file
@@ -1,13 +1,62 @@
-import requests
-import sys
-import os
-import time
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+import asyncio
+import numpy as np
+import orjson
 
 from typing import Dict, List, Tuple
-from config import settings
+from config import get_settings
+from tools._http import MapsStatusError, maps_get, memoize_success
+
+
+@memoize_success(maxsize=512)
+def _elevation_cached(path_points: Tuple[Tuple[float, float], ...], samples: int) -> Dict:
+    """Fetch and summarize an elevation profile, memoized per path and samples."""
+    url = "https://maps.googleapis.com/maps/api/elevation/json"
+
+    # Format path as pipe-separated coordinates, 6 decimals (~10cm) is all
+    # the Elevation API uses and keeps the URL short
+    path_str = "|".join(f"{p[0]:.6f},{p[1]:.6f}" for p in path_points)
+
+    params = {
+        "path": path_str,
+        "samples": samples,
+        "key": get_settings().google_maps_api_key
+    }
+
+    response = maps_get(url, params)
+    data = orjson.loads(response.content)
+
+    if data['status'] != 'OK':
+        raise MapsStatusError(f"API returned status: {data['status']}")
+
+    # One (n, 3) array of lat/lng/elevation rows, columns are sliced
+    # out as needed rather than building a dict per sample
+    samples_arr = np.array(
+        [(r['location']['lat'], r['location']['lng'], r['elevation']) for r in data['results']],
+        dtype=np.float64
+    ).reshape(-1, 3)
+    lats, lngs, elevs = samples_arr[:, 0], samples_arr[:, 1], samples_arr[:, 2]
+
+    # Calculate elevation gain/loss
+    elevation_changes = np.diff(elevs)
+    total_gain = float(np.clip(elevation_changes, 0, None).sum())
+    total_loss = float(-np.clip(elevation_changes, None, 0).sum())
+
+    max_elev = float(elevs.max())
+    min_elev = float(elevs.min())
+
+    return {
+        "status": "success",
+        "elevation_profile": {
+            "lats": lats.tolist(),
+            "lngs": lngs.tolist(),
+            "elevations": elevs.tolist()
+        },
+        "total_elevation_gain": round(total_gain, 2),
+        "total_elevation_loss": round(total_loss, 2),
+        "max_elevation": max_elev,
+        "min_elevation": min_elev
+    }
+
 
 def get_elevation_along_path(
     path_points: List[Tuple[float, float]],
@@ -16,75 +65,35 @@ def get_elevation_along_path(
     """
     Get elevation profile along a hiking path.
 
+    Profiles are cached per path and sample count, so re-analysing the
+    same route skips the API call.
+
     Args:
         path_points: List of (lat, lng) tuples defining the path
         samples: Number of elevation samples along the path
 
     Returns:
-        dict: Contains 'status' and elevation profile data
+        dict: Contains 'status' and elevation profile data, the profile
+            holds parallel 'lats', 'lngs' and 'elevations' lists
     """
-    start_time = time.time()
-
-
-    url = "https://maps.googleapis.com/maps/api/elevation/json"
-
-    # Format path as pipe-separated coordinates
-    path_str = "|".join([f"{lat},{lng}" for lat, lng in path_points])
-
-    params = {
-        "path": path_str,
-        "samples": samples,
-        "key": settings.google_maps_api_key
-    }
-
     try:
-        response = requests.get(url, params=params)
-        data = response.json()
-
-        duration_ms = int((time.time() - start_time) * 1000)
-
-        if data['status'] == 'OK':
-            elevations = [
-                {
-                    "lat": r['location']['lat'],
-                    "lng": r['location']['lng'],
-                    "elevation": r['elevation']
-                }
-                for r in data['results']
-            ]
-
-            # Calculate elevation gain/loss
-            total_gain = sum(
-                max(0, elevations[i]['elevation'] - elevations[i-1]['elevation'])
-                for i in range(1, len(elevations))
-            )
-            total_loss = sum(
-                max(0, elevations[i-1]['elevation'] - elevations[i]['elevation'])
-                for i in range(1, len(elevations))
-            )
-
-            max_elev = max(e['elevation'] for e in elevations)
-            min_elev = min(e['elevation'] for e in elevations)
-
-
-            return {
-                "status": "success",
-                "elevation_profile": elevations,
-                "total_elevation_gain": round(total_gain, 2),
-                "total_elevation_loss": round(total_loss, 2),
-                "max_elevation": max_elev,
-                "min_elevation": min_elev
-            }
-        else:
-            return {
-                "status": "error",
-                "error_message": f"API returned status: {data['status']}"
-            }
+        return _elevation_cached(tuple(map(tuple, path_points)), samples)
 
     except Exception as e:
-        duration_ms = int((time.time() - start_time) * 1000)
-
         return {
             "status": "error",
             "error_message": str(e)
-        }
\ No newline at end of file
+        }
+
+
+async def get_elevation_along_path_async(
+    path_points: List[Tuple[float, float]],
+    samples: int,
+) -> Dict:
+    """
+    Async get_elevation_along_path for agent tools.
+
+    Runs the blocking request in a worker thread so it doesn't stall the
+    ADK event loop.
+    """
+    return await asyncio.to_thread(get_elevation_along_path, path_points, samples)
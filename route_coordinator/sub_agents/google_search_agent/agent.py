@@ -1,12 +1,8 @@
 from google.adk.agents.llm_agent import LlmAgent
-from google.adk.models.lite_llm import LiteLlm
 from google.adk.tools import google_search
 from . import prompt
-from dotenv import load_dotenv
-import os
 import logging
 
-load_dotenv()
 logger = logging.getLogger(__name__)
 
 AGENT_NAME="google_search_agent"
@@ -1,9 +1,11 @@
-import os
+import asyncio
+from functools import lru_cache
+from types import MappingProxyType
 from google.adk.agents import Agent
 from google.adk.tools import ToolContext, AgentTool
 from google.adk.planners import PlanReActPlanner
 from typing import Dict, List, Optional
-from google.adk.models.lite_llm import LiteLlm
+from ..._models import SUB_AGENT_MODEL, get_llm
 from . import prompt
 from . import tools
 from ..google_search_agent import google_search_agent
@@ -12,8 +14,53 @@ import logging
 AGENT_NAME="location_scout"
 logger = logging.getLogger(__name__)
 
+# Map runner-friendly amenity types to Google Places API types, read-only
+# module constants so tool calls only ever do a lookup
+_AMENITY_MAPPING = MappingProxyType({
+    "restroom": "public_bathroom",
+    "water": "park",  # Parks often have water fountains
+    "cafe": "cafe",
+    "park": "park",
+    "gym": "gym",
+    "store": "convenience_store"
+})
+_AMENITY_CASEFOLD = MappingProxyType({k.casefold(): v for k, v in _AMENITY_MAPPING.items()})
 
-def scout_running_location(
+# (amenity, Places API type, search radius in meters) fetched by scout_all
+_SCOUT_ALL_AMENITIES = (
+    ("restroom", "public_bathroom", 2000),
+    ("cafe", "cafe", 2000),
+    ("park", "park", 5000),
+    ("gym", "gym", 2000),
+)
+
+
+async def _gather_places(searches) -> List[Dict]:
+    """
+    Run Places searches concurrently, in order.
+
+    A search that raises (or is cancelled, CancelledError is not an
+    Exception) surfaces as an error result for its own slot instead of
+    discarding the searches that did succeed.
+    """
+    results = await asyncio.gather(*searches, return_exceptions=True)
+    for i, result in enumerate(results):
+        if isinstance(result, BaseException):
+            logger.warning("Places search failed: %s", result, exc_info=result)
+            results[i] = {
+                "status": "error",
+                "error_message": str(result)
+            }
+    return results
+
+
+@lru_cache(maxsize=64)
+def _warn_unknown_amenity(amenity_type: str) -> None:
+    """Log an unmapped amenity type once instead of on every call."""
+    logger.warning("Unknown amenity type %r, passing it to Places unchanged", amenity_type)
+
+
+async def scout_running_location(
     location_name: str,
     tool_context: ToolContext
 ) -> Dict:
@@ -28,7 +75,7 @@ def scout_running_location(
     """
     
     logger.info("scout_running_location tool used")
-    result = tools.geocode_location(location_name)
+    result = await tools.geocode_location_async(location_name)
     
     if result['status'] == 'success' and tool_context:
         tool_context.state[f'location_{location_name}'] = {
@@ -39,7 +86,7 @@ def scout_running_location(
     return result
 
 
-def find_runner_amenities(
+async def find_runner_amenities(
     latitude: float,
     longitude: float,
     amenity_type: str,
@@ -59,73 +106,184 @@ def find_runner_amenities(
     """
 
     logger.info("find_runner_amenities tool used")
-    # Map runner-friendly amenity types to Google Places API types
-    amenity_mapping = {
-        "restroom": "toilet",
-        "water": "park",  # Parks often have water fountains
-        "cafe": "cafe",
-        "park": "park",
-        "gym": "gym",
-        "store": "convenience_store"
+    return await _search_amenity(latitude, longitude, amenity_type, radius)
+
+
+async def find_runner_amenities_batch(
+    latitude: float,
+    longitude: float,
+    amenity_types: List[str],
+    radius: int = 2000,
+) -> Dict:
+    """
+    Find several types of runner-friendly amenities in one call.
+
+    The Places searches for each type run concurrently.
+
+    Args:
+        latitude: Location latitude
+        longitude: Location longitude
+        amenity_types: Types of amenity (restroom, park, water, cafe, etc.)
+        radius: Search radius in meters (default 2km)
+
+    Returns:
+        dict: Nearby runner amenities keyed by amenity type
+    """
+    logger.info("find_runner_amenities_batch tool used")
+    results = await _gather_places([
+        _search_amenity(latitude, longitude, amenity_type, radius)
+        for amenity_type in amenity_types
+    ])
+
+    return {
+        "status": "success",
+        "amenities": dict(zip(amenity_types, results))
     }
-    
-    places_type = amenity_mapping.get(amenity_type.lower(), amenity_type)
-    
-    result = tools.find_nearby_places(
+
+
+async def _search_amenity(
+    latitude: float,
+    longitude: float,
+    amenity_type: str,
+    radius: int,
+) -> Dict:
+    """Run the Places search for one runner amenity type."""
+    places_type = _AMENITY_CASEFOLD.get(amenity_type.casefold())
+    if places_type is None:
+        # Unknown types are passed through to Places as-is
+        _warn_unknown_amenity(amenity_type)
+        places_type = amenity_type
+
+    result = await tools.find_nearby_places_async(
         lat=latitude,
         lng=longitude,
         place_type=places_type,
         radius=radius,
     )
-    
+
     if result['status'] == 'success':
         result['amenity_type'] = amenity_type
         result['message'] = f"Found {result['count']} {amenity_type} locations within {radius}m"
-    
+
     return result
 
 
-def find_running_start_points(
+async def find_running_start_points(
     location: str,
+    include_amenities: Optional[List[str]] = None,
 ) -> Dict:
     """
     Find good starting points for runs (parks, trails, waterfronts).
-    
+
+    After geocoding, the park search and any extra amenity searches run
+    concurrently.
+
     Args:
         location: General area to search
-        
+        include_amenities: Optional amenity types to find as well (restroom, cafe, etc.)
+
     Returns:
-        dict: Suggested starting points for runs
+        dict: Suggested starting points for runs, plus amenities by type if requested
     """
     logger.info("find_running_start_points tool used")
     # First geocode the location
-    geocode_result = tools.geocode_location(location)
+    geocode_result = await tools.geocode_location_async(location)
     
     if geocode_result['status'] != 'success':
         return geocode_result
     
     lat = geocode_result['latitude']
     lng = geocode_result['longitude']
-    
-    # Find parks (great running spots)
-    parks = tools.find_nearby_places(
-        lat=lat,
-        lng=lng,
-        place_type="park",
-        radius=5000,
-    )
-    
-    return {
+    amenity_types = include_amenities or []
+
+    # Find parks (great running spots) alongside the requested amenities
+    parks, *amenity_results = await _gather_places([
+        tools.find_nearby_places_async(
+            lat=lat,
+            lng=lng,
+            place_type="park",
+            radius=5000,
+        ),
+        *[
+            _search_amenity(lat, lng, amenity_type, 2000)
+            for amenity_type in amenity_types
+        ]
+    ])
+
+    result = {
         "status": "success",
         "location": location,
         "coordinates": {"lat": lat, "lng": lng},
         "nearby_parks": parks.get('places', []) if parks['status'] == 'success' else [],
         "recommendation": "Parks are excellent starting points with paths, water, and restrooms"
     }
+    if amenity_types:
+        result['amenities'] = dict(zip(amenity_types, amenity_results))
+
+    return result
+
+async def scout_all(
+    location_name: str,
+    tool_context: ToolContext
+) -> Dict:
+    """
+    Scout a location in one call: coordinates, starting points and amenities.
+
+    Geocodes the location once, then runs the Places searches for each
+    amenity type concurrently. The park results double as suggested
+    starting points.
+
+    Args:
+        location_name: Name of the location to scout
+
+    Returns:
+        dict: Coordinates, starting points and amenities by type
+    """
+    logger.info("scout_all tool used")
+    geocode_result = await tools.geocode_location_async(location_name)
+
+    if geocode_result['status'] != 'success':
+        return geocode_result
+
+    lat = geocode_result['latitude']
+    lng = geocode_result['longitude']
+
+    results = await _gather_places([
+        tools.find_nearby_places_async(
+            lat=lat,
+            lng=lng,
+            place_type=place_type,
+            radius=radius,
+        )
+        for _, place_type, radius in _SCOUT_ALL_AMENITIES
+    ])
+    amenities = {
+        amenity: result
+        for (amenity, _, _), result in zip(_SCOUT_ALL_AMENITIES, results)
+    }
+
+    parks = amenities['park']
+
+    if tool_context:
+        tool_context.state[f'location_{location_name}'] = {
+            'lat': lat,
+            'lng': lng
+        }
+        tool_context.state['location_amenities'] = amenities
+
+    return {
+        "status": "success",
+        "location": location_name,
+        "formatted_address": geocode_result['formatted_address'],
+        "coordinates": {"lat": lat, "lng": lng},
+        "nearby_parks": parks.get('places', []) if parks['status'] == 'success' else [],
+        "amenities": amenities,
+        "recommendation": "Parks are excellent starting points with paths, water, and restrooms"
+    }
 
 location_scout = Agent(
     name=AGENT_NAME,
-    model=LiteLlm(model=os.getenv("OPENAI_MODEL","GROK_MODEL")),
+    model=get_llm(SUB_AGENT_MODEL),
     description=(
         "Scouts locations and finds runner-friendly amenities"
         "like water fountains, restrooms, parks, and safe starting points for runs."
@@ -133,5 +291,5 @@ location_scout = Agent(
     planner=PlanReActPlanner(),
     instruction=prompt.LOCATION_SCOUT_PROMPT,
     output_key="location_scouting",
-    tools=[scout_running_location, find_runner_amenities, find_running_start_points, AgentTool(agent=google_search_agent)]
+    tools=[scout_all, scout_running_location, find_runner_amenities_batch, find_runner_amenities, find_running_start_points, AgentTool(agent=google_search_agent)]
 )
\ No newline at end of file
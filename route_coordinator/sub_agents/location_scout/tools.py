@@ -1,57 +1,207 @@
+import asyncio
+import orjson
+import re
 import requests
-import sys
-import os
 import time
+import logging
+import threading
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+from config import get_settings
+from tools._http import MapsStatusError, maps_get, maps_post, memoize_success
+from tools.cache import DiskCache
+from tools.gazetteer import Gazetteer
+
+logger = logging.getLogger(__name__)
+
+# Errors from a failed request or an unexpected response body
+_REQUEST_ERRORS = (requests.RequestException, KeyError, IndexError, ValueError)
+
+# "lat,lng" strings (as produced by the other agents) need no geocoding
+_COORD_RE = re.compile(r'^\s*(-?\d+(?:\.\d+)?)\s*,\s*(-?\d+(?:\.\d+)?)\s*$')
+
+_GEOCODE_URL = "https://maps.googleapis.com/maps/api/geocode/json"
+_PLACES_URL = "https://places.googleapis.com/v1/places:searchNearby"
+
+# Only the fields the tools return are requested, which trims the response
+# and keeps the search on the cheaper Places billing tier
+_PLACES_FIELD_MASK = "places.displayName,places.shortFormattedAddress,places.rating,places.location"
+_PLACES_MAX_RESULTS = 5
+
+# Places searches are cached per ~110m cell (3 decimal places of lat/lng)
+_PLACES_COORD_DECIMALS = 3
+_DISK_CACHE_TTL_S = 7 * 24 * 60 * 60
+
+
+# The location scout and route builder run in parallel and usually geocode
+# the same start location, a striped lock lets the second caller wait for
+# the first lookup and hit the cache instead of issuing a duplicate request
+_GEOCODE_LOCKS = tuple(threading.Lock() for _ in range(16))
+
+
+@lru_cache(maxsize=1)
+def _disk_cache() -> DiskCache:
+    """Cross-session cache for geocodes and places, keyed by cache version."""
+    settings = get_settings()
+    return DiskCache(
+        settings.maps_cache_path,
+        ttl_seconds=_DISK_CACHE_TTL_S,
+        namespace=f"v{settings.maps_cache_version}:",
+    )
+
+
+@lru_cache(maxsize=1)
+def _gazetteer() -> Optional[Gazetteer]:
+    """Local place-name lookup, if one is configured."""
+    path = get_settings().gazetteer_path
+    return Gazetteer(path) if path else None
+
+
+@memoize_success(maxsize=4096)
+def _geocode_cached(location_name: str) -> Tuple[float, float, str, Optional[str]]:
+    """
+    Geocode a normalized location name, memoized in process and on disk.
+
+    Names found in the local gazetteer skip the network entirely.
+    """
+    gazetteer = _gazetteer()
+    local = gazetteer.lookup(location_name) if gazetteer else None
+    if local is not None:
+        lat, lng, formatted_address = local
+        return (lat, lng, formatted_address, None)
+
+    cache_key = f"geocode:{location_name}"
+    cached = _disk_cache().get(cache_key)
+    if cached is not None:
+        return tuple(cached)
+
+    params = {
+        "address": location_name,
+        "key": get_settings().google_maps_api_key
+    }
+
+    response = maps_get(_GEOCODE_URL, params)
+    data = orjson.loads(response.content)
+
+    if data['status'] != 'OK':
+        raise MapsStatusError(f"Geocoding failed: {data['status']}")
+
+    result = data['results'][0]
+    geocode = (
+        result['geometry']['location']['lat'],
+        result['geometry']['location']['lng'],
+        result['formatted_address'],
+        result.get('place_id')
+    )
+    _disk_cache().set(cache_key, geocode)
+    return geocode
+
+
+@memoize_success(maxsize=1024)
+def _nearby_places_cached(lat: float, lng: float, place_type: str, radius: int) -> Tuple[Dict, ...]:
+    """
+    Run a Places nearby search, memoized in process and on disk.
+
+    Callers round lat/lng first so nearby points share an entry.
+    """
+    cache_key = f"places:{lat},{lng}:{place_type}:{radius}"
+    cached = _disk_cache().get(cache_key)
+    if cached is not None:
+        return tuple(cached)
+
+    body = {
+        "includedTypes": [place_type],
+        "maxResultCount": _PLACES_MAX_RESULTS,
+        "locationRestriction": {
+            "circle": {
+                "center": {"latitude": lat, "longitude": lng},
+                "radius": radius
+            }
+        }
+    }
+    headers = {
+        "X-Goog-Api-Key": get_settings().google_maps_api_key,
+        "X-Goog-FieldMask": _PLACES_FIELD_MASK
+    }
+
+    response = maps_post(_PLACES_URL, body, headers)
+    data = orjson.loads(response.content)
+
+    # Places (New) reports failures through the HTTP status and an error body
+    if response.status_code != 200:
+        status = data.get('error', {}).get('status', response.status_code)
+        raise MapsStatusError(f"Places API returned: {status}")
+
+    # An empty search returns {} rather than an empty list
+    places = tuple(
+        {
+            "name": place.get('displayName', {}).get('text', 'N/A'),
+            "address": place.get('shortFormattedAddress', 'N/A'),
+            "rating": place.get('rating', 'N/A'),
+            "latitude": place['location']['latitude'],
+            "longitude": place['location']['longitude']
+        }
+        for place in data.get('places', [])
+    )
+    _disk_cache().set(cache_key, places)
+    return places
 
-from typing import Dict, List
-from config import settings
 
 def geocode_location(location_name: str) -> Dict:
     """
     Convert location name to coordinates.
 
+    Results are cached by normalized name (in process and on disk), so
+    repeated lookups of the same place skip the API call. A "lat,lng"
+    string is returned as-is without any lookup.
+
     Args:
         location_name: Name of the location to geocode
 
     Returns:
         dict: Contains lat/lng coordinates and formatted address
     """
-    start_time = time.time()
+    match = _COORD_RE.match(location_name)
+    if match:
+        lat, lng = float(match.group(1)), float(match.group(2))
+        if -90 <= lat <= 90 and -180 <= lng <= 180:
+            return {
+                "status": "success",
+                "latitude": lat,
+                "longitude": lng,
+                "formatted_address": f"{lat},{lng}",
+                "place_id": None
+            }
 
-    url = "https://maps.googleapis.com/maps/api/geocode/json"
-    params = {
-        "address": location_name,
-        "key": settings.google_maps_api_key
-    }
+    start_time = time.perf_counter()
 
     try:
-        response = requests.get(url, params=params)
-        data = response.json()
-
-        duration_ms = int((time.time() - start_time) * 1000)
+        # Case and spacing don't change the lookup, fold them so variants share an entry
+        normalized_name = " ".join(location_name.split()).lower()
+        with _GEOCODE_LOCKS[hash(normalized_name) % len(_GEOCODE_LOCKS)]:
+            lat, lng, formatted_address, place_id = _geocode_cached(normalized_name)
 
-        if data['status'] == 'OK':
-            result = data['results'][0]
+        # Timing is only worth computing when someone is reading debug logs
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Geocoded %r in %.0fms", location_name, (time.perf_counter() - start_time) * 1000)
 
+        return {
+            "status": "success",
+            "latitude": lat,
+            "longitude": lng,
+            "formatted_address": formatted_address,
+            "place_id": place_id
+        }
 
-            return {
-                "status": "success",
-                "latitude": result['geometry']['location']['lat'],
-                "longitude": result['geometry']['location']['lng'],
-                "formatted_address": result['formatted_address'],
-                "place_id": result.get('place_id')
-            }
-        else:
-            return {
-                "status": "error",
-                "error_message": f"Geocoding failed: {data['status']}"
-            }
+    except MapsStatusError as e:
+        return {
+            "status": "error",
+            "error_message": str(e)
+        }
 
-    except Exception as e:
-        duration_ms = int((time.time() - start_time) * 1000)
+    except _REQUEST_ERRORS as e:
+        logger.warning("Geocoding %r failed: %s", location_name, e)
 
         return {
             "status": "error",
@@ -68,6 +218,9 @@ def find_nearby_places(
     """
     Find places near a location (trailheads, parking, amenities).
 
+    Results are cached (in process and on disk) per rounded location,
+    place type and radius.
+
     Args:
         lat: Latitude
         lng: Longitude
@@ -77,50 +230,60 @@ def find_nearby_places(
     Returns:
         dict: List of nearby places with details
     """
-    start_time = time.time()
-
-    url = "https://maps.googleapis.com/maps/api/place/nearbysearch/json"
-    params = {
-        "location": f"{lat},{lng}",
-        "radius": radius,
-        "type": place_type,
-        "key": settings.google_maps_api_key
-    }
+    start_time = time.perf_counter()
 
     try:
-        response = requests.get(url, params=params)
-        data = response.json()
-
-        duration_ms = int((time.time() - start_time) * 1000)
-
-        if data['status'] == 'OK':
-            places = [
-                {
-                    "name": place['name'],
-                    "address": place.get('vicinity', 'N/A'),
-                    "rating": place.get('rating', 'N/A'),
-                    "latitude": place['geometry']['location']['lat'],
-                    "longitude": place['geometry']['location']['lng']
-                }
-                for place in data['results'][:5]  # Top 5 results
-            ]
+        places = _nearby_places_cached(
+            round(lat, _PLACES_COORD_DECIMALS),
+            round(lng, _PLACES_COORD_DECIMALS),
+            place_type,
+            radius
+        )
 
-            return {
-                "status": "success",
-                "places": places,
-                "count": len(places)
-            }
-        else:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Places search for %s near %s,%s took %.0fms",
+                place_type, lat, lng, (time.perf_counter() - start_time) * 1000
+            )
 
-            return {
-                "status": "error",
-                "error_message": f"Places API returned: {data['status']}"
-            }
+        return {
+            "status": "success",
+            "places": list(places),
+            "count": len(places)
+        }
 
-    except Exception as e:
-        duration_ms = int((time.time() - start_time) * 1000)
-     
+    except MapsStatusError as e:
         return {
             "status": "error",
             "error_message": str(e)
-        }
\ No newline at end of file
+        }
+
+    except _REQUEST_ERRORS as e:
+        logger.warning("Places search for %s near %s,%s failed: %s", place_type, lat, lng, e)
+
+        return {
+            "status": "error",
+            "error_message": str(e)
+        }
+
+
+async def geocode_location_async(location_name: str) -> Dict:
+    """
+    Async geocode_location for agent tools.
+
+    Runs the blocking call in a worker thread so the ADK event loop (and
+    the agents running in parallel with this one) keep going meanwhile.
+    """
+    return await asyncio.to_thread(geocode_location, location_name)
+
+
+async def find_nearby_places_async(
+    lat: float,
+    lng: float,
+    place_type: str,
+    radius: int,
+) -> Dict:
+    """
+    Async find_nearby_places for agent tools, see geocode_location_async.
+    """
+    return await asyncio.to_thread(find_nearby_places, lat, lng, place_type, radius)
@@ -1,18 +1,48 @@
-import os
 import math
+from functools import lru_cache
+import numpy as np
 from google.adk.agents import Agent
 from google.adk.tools import ToolContext
-from typing import Dict, List, Optional
-from google.adk.models.lite_llm import LiteLlm
+from typing import Dict, List, Optional, Tuple
 
+from ..._models import SUB_AGENT_MODEL, get_llm
 from . import prompt
 from . import tools
-from ..location_scout.tools import geocode_location
+from ..location_scout.tools import geocode_location_async
+from tools.maps_url_tools import generate_google_maps_url
 import logging
 
 AGENT_NAME="route_builder"
 logger = logging.getLogger(__name__)
 
+# Typical running paces: (estimated_times key, min/km, label)
+_PACE_TIERS = (
+    ("easy_pace", 6.5, "6:30/km"),
+    ("moderate_pace", 5.5, "5:30/km"),
+    ("fast_pace", 4.5, "4:30/km"),
+)
+
+# Routes follow streets rather than straight lines (Manhattan distance factor ~1.3)
+_MANHATTAN_FACTOR = 1.3
+# Perimeter = distance_km, so loop radius ≈ distance_km / _LOOP_DIVISOR
+_LOOP_DIVISOR = 2 * math.pi * _MANHATTAN_FACTOR
+_KM_PER_DEGREE_LAT = 111
+
+
+@lru_cache(maxsize=2048)
+def _deg_per_km(lat_rounded: float) -> Tuple[float, float]:
+    """
+    Degrees of (latitude, longitude) per km at a latitude.
+
+    1 degree latitude ≈ 111 km, 1 degree longitude ≈ 111 km * cos(latitude).
+    Callers round the latitude to 2 decimals (~1km), well within the
+    accuracy of these estimates, so repeat starts reuse the trig.
+    """
+    return (
+        1 / _KM_PER_DEGREE_LAT,
+        1 / (_KM_PER_DEGREE_LAT * math.cos(math.radians(lat_rounded)))
+    )
+
 
 def _generate_loop_waypoints(lat: float, lng: float, distance_km: float, num_points: int = 4) -> List[str]:
     """
@@ -32,32 +62,23 @@ def _generate_loop_waypoints(lat: float, lng: float, distance_km: float, num_poi
     """
     logger.info("_generate_loop_waypoints tool used")
     # For a loop with N waypoints, estimate the radius needed
-    # Assume the route follows streets (Manhattan distance factor ~1.3)
-    # Perimeter = distance_km, so radius ≈ distance_km / (2 * π * 1.3)
-    manhattan_factor = 1.3
-    radius_km = distance_km / (2 * math.pi * manhattan_factor)
+    radius_km = distance_km / _LOOP_DIVISOR
 
     # Convert km to degrees (approximate)
-    # 1 degree latitude ≈ 111 km
-    # 1 degree longitude ≈ 111 km * cos(latitude)
-    lat_offset = radius_km / 111
-    lng_offset = radius_km / (111 * math.cos(math.radians(lat)))
-
-    waypoints = []
+    lat_per_km, lng_per_km = _deg_per_km(round(lat, 2))
+    lat_offset = radius_km * lat_per_km
+    lng_offset = radius_km * lng_per_km
 
     # Generate waypoints evenly distributed around a circle
     # Start at 45° to create a more natural route pattern
-    angle_step = 360 / num_points
-    start_angle = 45
+    start_angle = math.radians(45)
+    angles = np.linspace(start_angle, start_angle + 2 * math.pi, num_points, endpoint=False)
+    wp_lats = lat + lat_offset * np.sin(angles)
+    wp_lngs = lng + lng_offset * np.cos(angles)
 
-    for i in range(num_points):
-        angle = start_angle + (i * angle_step)
-        angle_rad = math.radians(angle)
-        wp_lat = lat + (lat_offset * math.sin(angle_rad))
-        wp_lng = lng + (lng_offset * math.cos(angle_rad))
-        waypoints.append(f"{wp_lat},{wp_lng}")
-
-    return waypoints
+    # 6 decimals (~10cm) is far beyond the waypoint accuracy and keeps the
+    # Directions and Maps URLs short
+    return [f"{wp_lat:.6f},{wp_lng:.6f}" for wp_lat, wp_lng in zip(wp_lats.tolist(), wp_lngs.tolist())]
 
 
 def _generate_out_and_back_waypoint(lat: float, lng: float, distance_km: float, direction: float) -> List[str]:
@@ -80,25 +101,21 @@ def _generate_out_and_back_waypoint(lat: float, lng: float, distance_km: float,
     logger.info("_generate_out_and_back_waypoint tool used")
 
     # For out-and-back, the waypoint should be at half the target distance
-    # Account for street following (Manhattan distance factor ~1.3)
-    manhattan_factor = 1.3
-    one_way_distance_km = (distance_km / 2) / manhattan_factor
+    # Account for street following
+    one_way_distance_km = (distance_km / 2) / _MANHATTAN_FACTOR
 
     # Convert km to degrees (approximate)
-    # 1 degree latitude ≈ 111 km
-    # 1 degree longitude ≈ 111 km * cos(latitude)
-    lat_offset_per_km = 1 / 111
-    lng_offset_per_km = 1 / (111 * math.cos(math.radians(lat)))
+    lat_offset_per_km, lng_offset_per_km = _deg_per_km(round(lat, 2))
 
     # Calculate waypoint position based on direction
     direction_rad = math.radians(direction)
     wp_lat = lat + (one_way_distance_km * lat_offset_per_km * math.cos(direction_rad))
     wp_lng = lng + (one_way_distance_km * lng_offset_per_km * math.sin(direction_rad))
 
-    return [f"{wp_lat},{wp_lng}"]
+    return [f"{wp_lat:.6f},{wp_lng:.6f}"]
 
 
-def find_running_route(
+async def find_running_route(
     start_location: str,
     end_location: Optional[str] = None,
     distance_target_km: Optional[float] = None,
@@ -120,6 +137,9 @@ def find_running_route(
     logger.info("find_running_route tool used")
 
     waypoints = None
+    # Directions gets the resolved coordinates when we already geocoded the
+    # start, so Google doesn't geocode the name again server-side
+    origin, destination = start_location, end_location
 
     # Generate loop with waypoints if requested
     if is_loop:
@@ -130,7 +150,7 @@ def find_running_route(
             }
 
         # Geocode the start location to get coordinates
-        coords = geocode_location(start_location)
+        coords = await geocode_location_async(start_location)
         if coords['status'] != 'success':
             return coords
 
@@ -143,6 +163,7 @@ def find_running_route(
 
         # For a loop, end where we start
         end_location = start_location
+        origin = destination = f"{coords['latitude']},{coords['longitude']}"
 
     # If no end location and not a loop, make it out-and-back with a waypoint
     elif not end_location:
@@ -153,7 +174,7 @@ def find_running_route(
             }
 
         # Geocode the start location to get coordinates
-        coords = geocode_location(start_location)
+        coords = await geocode_location_async(start_location)
         if coords['status'] != 'success':
             return coords
 
@@ -168,10 +189,11 @@ def find_running_route(
 
         # For out-and-back, end where we start
         end_location = start_location
+        origin = destination = f"{coords['latitude']},{coords['longitude']}"
 
-    result = tools.get_running_directions(
-        origin=start_location,
-        destination=end_location,
+    result = await tools.get_running_directions_async(
+        origin=origin,
+        destination=destination,
         waypoints=waypoints
     )
     
@@ -180,23 +202,14 @@ def find_running_route(
         distance_km = result['total_distance'] / 1000
         
         # Calculate pace estimates for different runner levels
-        # Base walking time from API, convert to running estimates
-        base_minutes = result['total_duration'] / 60
-        
-        # Typical running paces (min/km)
-        easy_pace = 6.5  # 6:30/km
-        moderate_pace = 5.5  # 5:30/km
-        fast_pace = 4.5  # 4:30/km
-        
         result['distance_km'] = round(distance_km, 2)
         result['estimated_times'] = {
-            'easy_pace': f"{distance_km * easy_pace:.0f} min ({easy_pace:.1f} min/km)",
-            'moderate_pace': f"{distance_km * moderate_pace:.0f} min ({moderate_pace:.1f} min/km)",
-            'fast_pace': f"{distance_km * fast_pace:.0f} min ({fast_pace:.1f} min/km)"
+            key: f"{distance_km * pace:.0f} min ({label})"
+            for key, pace, label in _PACE_TIERS
         }
         
         # Generate Google Maps URL (include waypoints if they exist)
-        maps_url = tools.generate_google_maps_url(
+        maps_url = generate_google_maps_url(
             origin=start_location,
             destination=end_location,
             waypoints=waypoints,
@@ -208,11 +221,12 @@ def find_running_route(
         if tool_context:
             tool_context.state['route_coordinates'] = result['path_coordinates']
             tool_context.state['route_distance_km'] = distance_km
+            tool_context.state['google_maps_url'] = result['google_maps_url']
     
     return result
 
 
-def suggest_loop_routes(
+async def suggest_loop_routes(
     location: str,
     distance_km: float ,
     tool_context: ToolContext
@@ -231,7 +245,7 @@ def suggest_loop_routes(
     """
     logger.info("suggest_loop_routes tool used")
     # Use find_running_route with is_loop=True to generate an actual loop
-    return find_running_route(
+    return await find_running_route(
         start_location=location,
         distance_target_km=distance_km,
         is_loop=True,
@@ -241,7 +255,7 @@ def suggest_loop_routes(
 
 route_builder = Agent(
     name=AGENT_NAME,
-    model=LiteLlm(model=os.getenv("OPENAI_MODEL","GROK_MODEL")),
+    model=get_llm(SUB_AGENT_MODEL),
     description=(
         "Finds optimal running routes including loops, out-and-backs,"
         "and point-to-point courses. Calculates distances and provides pace estimates."
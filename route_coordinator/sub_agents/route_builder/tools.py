@@ -1,44 +1,30 @@
-import requests
-import sys
-import os
-import time
+import asyncio
+import orjson
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
+from config import get_settings
+from tools._http import MapsStatusError, maps_get, memoize_success
 
-from typing import Dict, List, Optional
-from urllib.parse import quote
-from config import settings
+# (lat, lng) tuple from a Directions {"lat": .., "lng": ..} location
+_lat_lng = itemgetter('lat', 'lng')
 
 
-def get_running_directions(
+@memoize_success(maxsize=512)
+def _directions_cached(
     origin: str,
     destination: str,
-    waypoints: List[str] = None,
-    avoid_highways: bool = True,
+    waypoints: Optional[Tuple[str, ...]],
+    avoid_highways: bool,
 ) -> Dict:
-    """
-    Get running directions between locations.
-
-    Args:
-        origin: Starting location
-        destination: Ending location
-        waypoints: Optional list of intermediate points
-        avoid_highways: Avoid major highways (default True for safety)
-
-    Returns:
-        dict: Route information optimized for runners
-    """
-    start_time = time.time()
-
-
+    """Fetch and summarize walking directions, memoized per request."""
     url = "https://maps.googleapis.com/maps/api/directions/json"
 
     params = {
         "origin": origin,
         "destination": destination,
         "mode": "walking",  # Walking mode for runners
-        "key": settings.google_maps_api_key
+        "key": get_settings().google_maps_api_key
     }
 
     if waypoints:
@@ -50,111 +36,90 @@ def get_running_directions(
     # Request alternative routes for variety
     params["alternatives"] = "true"
 
-    try:
-        response = requests.get(url, params=params)
-        data = response.json()
-
-        duration_ms = int((time.time() - start_time) * 1000)
-
-        if data['status'] == 'OK':
-            # Get the best route (or first alternative)
-            route = data['routes'][0]
-            legs = route['legs']
-
-            # Extract path coordinates
-            path_coordinates = []
-            for leg in legs:
-                for step in leg['steps']:
-                    path_coordinates.append((
-                        step['start_location']['lat'],
-                        step['start_location']['lng']
-                    ))
-            path_coordinates.append((
-                legs[-1]['end_location']['lat'],
-                legs[-1]['end_location']['lng']
-            ))
-
-            total_distance = sum(leg['distance']['value'] for leg in legs)
-            total_distance_km = total_distance / 1000
-
-            return {
-                "status": "success",
-                "total_distance": total_distance,
-                "path_coordinates": path_coordinates,
-                "summary": route.get('summary', 'Route found'),
-                "total_duration": sum(leg['duration']['value'] for leg in legs),
-                "num_alternatives": len(data['routes']),
-                "legs": [
-                    {
-                        "start_address": leg['start_address'],
-                        "end_address": leg['end_address'],
-                        "distance": leg['distance']['text'],
-                        "duration": leg['duration']['text']
-                    }
-                    for leg in legs
-                ]
-            }
-        else:
-            return {
-                "status": "error",
-                "error_message": f"Directions API returned: {data['status']}"
+    response = maps_get(url, params)
+    data = orjson.loads(response.content)
+
+    if data['status'] != 'OK':
+        raise MapsStatusError(f"Directions API returned: {data['status']}")
+
+    # Get the best route (or first alternative)
+    route = data['routes'][0]
+    legs = route['legs']
+
+    # Extract path coordinates: each step's start, then the route's end
+    path_coordinates = [_lat_lng(step['start_location']) for leg in legs for step in leg['steps']]
+    path_coordinates.append(_lat_lng(legs[-1]['end_location']))
+
+    total_distance = total_duration = 0
+    for leg in legs:
+        total_distance += leg['distance']['value']
+        total_duration += leg['duration']['value']
+
+    return {
+        "status": "success",
+        "total_distance": total_distance,
+        "path_coordinates": path_coordinates,
+        "summary": route.get('summary', 'Route found'),
+        "total_duration": total_duration,
+        "num_alternatives": len(data['routes']),
+        "legs": [
+            {
+                "start_address": leg['start_address'],
+                "end_address": leg['end_address'],
+                "distance": leg['distance']['text'],
+                "duration": leg['duration']['text']
             }
-
-    except Exception as e:
-        duration_ms = int((time.time() - start_time) * 1000)
-       
-        return {
-            "status": "error",
-            "error_message": str(e)
-        }
+            for leg in legs
+        ]
+    }
 
 
-def generate_google_maps_url(
+def get_running_directions(
     origin: str,
     destination: str,
     waypoints: List[str] = None,
-    travel_mode: str = "walking"
+    avoid_highways: bool = True,
 ) -> Dict:
     """
-    Generate a Google Maps URL to view the route.
+    Get running directions between locations.
+
+    Routes are cached per origin, destination, waypoints and highway
+    setting, so re-planning the same route skips the API call.
 
     Args:
         origin: Starting location
         destination: Ending location
-        waypoints: Optional list of waypoints
-        travel_mode: driving, walking, bicycling, or transit
+        waypoints: Optional list of intermediate points
+        avoid_highways: Avoid major highways (default True for safety)
 
     Returns:
-        dict: Contains the Google Maps URL
+        dict: Route information optimized for runners
     """
-
     try:
-        base_url = "https://www.google.com/maps/dir/"
-
-        # URL encode locations
-        encoded_origin = quote(origin)
-        encoded_destination = quote(destination)
-
-        # Build URL with waypoints
-        if waypoints:
-            encoded_waypoints = "/".join([quote(wp) for wp in waypoints])
-            url = f"{base_url}{encoded_origin}/{encoded_waypoints}/{encoded_destination}"
-        else:
-            url = f"{base_url}{encoded_origin}/{encoded_destination}"
-
-        # Add travel mode parameter
-        url += f"/@?travelmode={travel_mode}"
-
-
-        return {
-            "status": "success",
-            "maps_url": url,
-            "message": f"Click here to view route in Google Maps: {url}"
-        }
+        return _directions_cached(
+            origin,
+            destination,
+            tuple(waypoints) if waypoints else None,
+            avoid_highways
+        )
 
     except Exception as e:
-    
         return {
             "status": "error",
             "error_message": str(e)
-        }
\ No newline at end of file
+        }
+
+
+async def get_running_directions_async(
+    origin: str,
+    destination: str,
+    waypoints: List[str] = None,
+    avoid_highways: bool = True,
+) -> Dict:
+    """
+    Async get_running_directions for agent tools.
+
+    Runs the blocking request in a worker thread so it doesn't stall the
+    ADK event loop.
+    """
+    return await asyncio.to_thread(get_running_directions, origin, destination, waypoints, avoid_highways)
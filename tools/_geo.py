@@ -0,0 +1,31 @@
+"""Vectorized geodesy helpers shared by the route tools."""
+
+import numpy as np
+
+EARTH_RADIUS_M = 6371000.0
+
+
+def cum_haversine(lats: np.ndarray, lngs: np.ndarray) -> np.ndarray:
+    """
+    Cumulative great-circle distance along a path of points.
+
+    Args:
+        lats: Latitudes in degrees, one per point
+        lngs: Longitudes in degrees, one per point
+
+    Returns:
+        np.ndarray: Meters travelled at each point (0 at the first),
+            the last entry is the total path length
+    """
+    lat_r = np.radians(np.asarray(lats, dtype=np.float64))
+    lng_r = np.radians(np.asarray(lngs, dtype=np.float64))
+    distances = np.zeros(lat_r.size)
+    if lat_r.size < 2:
+        return distances
+
+    # Haversine distance between consecutive points
+    lat1 = lat_r[:-1]
+    lat2 = lat_r[1:]
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(np.diff(lng_r) / 2) ** 2
+    np.cumsum(2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(a)), out=distances[1:])
+    return distances
@@ -0,0 +1,201 @@
+"""Shared HTTP session for the Maps and route API tools."""
+
+import logging
+import threading
+import time
+from copy import deepcopy
+from functools import lru_cache, wraps
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# (connect, read) seconds to wait on Maps/route APIs, a dead host fails
+# fast on connect while slow responses still get time to arrive
+DEFAULT_TIMEOUT = (3, 10)
+
+
+def _retry(allowed_methods) -> Retry:
+    """Retry policy for transient 429/5xx responses on the given methods."""
+    return Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=allowed_methods,
+    )
+
+
+# One pooled session per process so every tool reuses keep-alive connections,
+# transient 429/5xx responses are retried here instead of failing the tool.
+# Only idempotent reads are retried, a failed POST is left to the caller...
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=50,
+    max_retries=_retry(("GET", "HEAD")),
+))
+# ...except Places searchNearby, a read-only search sent as a POST body
+SESSION.mount("https://places.googleapis.com/", HTTPAdapter(
+    pool_maxsize=50,
+    max_retries=_retry(("GET", "HEAD", "POST")),
+))
+
+# After a host times out or refuses connections, requests to it fail
+# immediately for this long instead of each waiting out the timeout again
+_CIRCUIT_COOLDOWN_S = 30
+_circuit_open_until: Dict[str, float] = {}
+
+# Published per-host request caps (requests, seconds), kept a little under
+# the limit so concurrent tool calls queue instead of hitting 429s
+_HOST_RATE_LIMITS = {
+    "www.strava.com": (550, 15 * 60),
+    "api.mapbox.com": (250, 60),
+}
+
+# Hosts the first user request will hit, see warm_connections
+_WARM_HOSTS = ("https://maps.googleapis.com/", "https://places.googleapis.com/")
+
+
+class _RateLimiter:
+    """
+    Thread-safe token bucket allowing `calls` requests per `period` seconds.
+
+    acquire() blocks the calling (worker) thread until a token is free.
+    The bucket starts full, so short bursts go straight through.
+    """
+
+    def __init__(self, calls: int, period: float):
+        self.capacity = calls
+        self.refill_per_s = calls / period
+        self._tokens = float(calls)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_per_s)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.refill_per_s
+            time.sleep(wait)
+
+
+_RATE_LIMITERS = {host: _RateLimiter(*limit) for host, limit in _HOST_RATE_LIMITS.items()}
+
+
+@lru_cache(maxsize=1)
+def _maps_gate() -> threading.BoundedSemaphore:
+    """Process-wide cap on in-flight Google Maps requests."""
+    return threading.BoundedSemaphore(get_settings().gmaps_max_concurrency)
+
+
+def maps_get(url: str, params: dict) -> requests.Response:
+    """
+    GET a Google Maps API endpoint through the shared session.
+
+    At most gmaps_max_concurrency requests run at once across all tools,
+    so concurrent fan-out (amenity batches, parallel agents) queues here
+    instead of tripping the per-second quota and backing off on 429s.
+    Retries happen while holding the slot, which slows the burst down
+    further when Google does push back.
+    """
+    with _maps_gate():
+        return SESSION.get(url, params=params, timeout=DEFAULT_TIMEOUT)
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """Request skipped because its host recently failed, see api_get."""
+
+
+def api_get(url: str, params: Optional[dict] = None, headers: Optional[dict] = None) -> requests.Response:
+    """
+    GET a third-party API (Strava, Hiking Project, Mapbox) through the shared session.
+
+    Timeouts, connection failures and exhausted retries open a circuit
+    for that host. Until _CIRCUIT_COOLDOWN_S has passed, further calls to
+    it raise CircuitOpenError right away, so a degraded upstream costs
+    one timeout rather than one per tool call. Hosts with a published
+    rate limit are throttled to it (see _HOST_RATE_LIMITS).
+    """
+    host = urlsplit(url).netloc
+    if time.monotonic() < _circuit_open_until.get(host, 0):
+        raise CircuitOpenError(f"{host} is temporarily unavailable, skipping request")
+
+    limiter = _RATE_LIMITERS.get(host)
+    if limiter is not None:
+        limiter.acquire()
+
+    try:
+        return SESSION.get(url, params=params, headers=headers, timeout=DEFAULT_TIMEOUT)
+    except (requests.ConnectionError, requests.Timeout, requests.exceptions.RetryError):
+        logger.warning("%s failed, skipping it for %ss", host, _CIRCUIT_COOLDOWN_S)
+        _circuit_open_until[host] = time.monotonic() + _CIRCUIT_COOLDOWN_S
+        raise
+
+
+def maps_post(url: str, body: dict, headers: dict) -> requests.Response:
+    """
+    POST a JSON body to a Google Maps API endpoint through the shared session.
+
+    Used by the newer Maps APIs (e.g. Places searchNearby) that take the
+    request as JSON, shares the concurrency gate with maps_get.
+    """
+    with _maps_gate():
+        return SESSION.post(url, json=body, headers=headers, timeout=DEFAULT_TIMEOUT)
+
+
+class MapsStatusError(Exception):
+    """A Maps API answered with a non-OK status, never memoized."""
+
+
+def memoize_success(maxsize: int):
+    """
+    lru_cache for Maps lookups that hands every caller its own copy.
+
+    Only returned values are cached, a call that raises (MapsStatusError,
+    a request error) is retried on the next call. Callers get a deep copy
+    so adding keys or editing nested lists never reaches the cached entry.
+    cache_info and cache_clear pass through to the underlying lru_cache.
+    """
+    def decorator(func):
+        cached = lru_cache(maxsize=maxsize)(func)
+
+        @wraps(func)
+        def wrapper(*args):
+            return deepcopy(cached(*args))
+
+        wrapper.cache_info = cached.cache_info
+        wrapper.cache_clear = cached.cache_clear
+        return wrapper
+
+    return decorator
+
+
+def _warm(url: str) -> None:
+    """Make one throwaway request so the session keeps a live connection to url."""
+    try:
+        SESSION.head(url, timeout=DEFAULT_TIMEOUT)
+    except requests.RequestException as e:
+        logger.debug("Connection warm-up for %s failed: %s", url, e)
+
+
+def warm_connections() -> None:
+    """
+    Open pooled connections to the Maps hosts in the background.
+
+    The DNS lookup and TLS handshake then happen while the user is still
+    typing their first request, instead of on that request. Failures are
+    ignored, the real request just connects as usual.
+    """
+    for url in _WARM_HOSTS:
+        threading.Thread(target=_warm, args=(url,), name="http-warmup", daemon=True).start()
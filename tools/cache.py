@@ -0,0 +1,90 @@
+"""Persistent cache for API results that rarely change (geocodes, places)."""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Optional
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+
+class DiskCache:
+    """
+    Small SQLite-backed key/value cache with per-entry expiry.
+
+    Values are stored as JSON, so tuples come back as lists. Cache errors
+    are logged and treated as misses, they never fail the caller.
+
+    Args:
+        path: SQLite file to store entries in (created on first use)
+        ttl_seconds: How long an entry stays valid after it is written
+        namespace: Prefix for every key, bump it to invalidate old entries
+    """
+
+    def __init__(self, path: str, ttl_seconds: float, namespace: str = ""):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                # Owner-only, cached responses shouldn't be readable (or
+                # replaceable) by other users on a shared machine
+                os.makedirs(directory, mode=0o700, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+            )
+        return self._conn
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT value, expires_at FROM cache WHERE key = ?",
+                    (self.namespace + key,)
+                ).fetchone()
+            if row is None or row[1] < time.time():
+                return None
+            return orjson.loads(row[0])
+        except orjson.JSONDecodeError as e:
+            # A corrupt entry is dropped so the next set() replaces it cleanly
+            logger.warning("Disk cache entry %r in %s is unreadable, dropping it: %s", key, self.path, e)
+            self.delete(key)
+            return None
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("Disk cache read from %s failed: %s", self.path, e)
+            return None
+
+    def delete(self, key: str) -> None:
+        """Remove key from the cache if it is there."""
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute("DELETE FROM cache WHERE key = ?", (self.namespace + key,))
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("Disk cache delete from %s failed: %s", self.path, e)
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value under key."""
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                        (self.namespace + key, orjson.dumps(value), time.time() + self.ttl_seconds)
+                    )
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("Disk cache write to %s failed: %s", self.path, e)
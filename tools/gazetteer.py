@@ -0,0 +1,99 @@
+"""Offline place-name lookup built from a GeoNames cities dump."""
+
+import csv
+import logging
+import os
+import sqlite3
+import sys
+import threading
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Column positions in the GeoNames cities*.txt tab-separated dumps
+_NAME, _ASCII_NAME, _LAT, _LNG, _COUNTRY, _POPULATION = 1, 2, 4, 5, 8, 14
+
+
+class Gazetteer:
+    """
+    Read-only lookup of place names in a local SQLite gazetteer.
+
+    Names match exactly, ignoring case. When several places share a name,
+    the most populous one wins. A missing or unreadable database is
+    logged once and every lookup misses.
+
+    Args:
+        path: SQLite file written by build_gazetteer
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = None
+        self._disabled = False
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self._conn is None and not self._disabled:
+            if not os.path.exists(self.path):
+                logger.warning("Gazetteer %s not found, using Google geocoding only", self.path)
+                self._disabled = True
+                return None
+            # Opened read-only, the gazetteer is built offline
+            self._conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+        return self._conn
+
+    def lookup(self, name: str) -> Optional[Tuple[float, float, str]]:
+        """Return (lat, lng, 'Name, CC') for a place name, or None if it isn't known."""
+        try:
+            with self._lock:
+                conn = self._connect()
+                if conn is None:
+                    return None
+                return conn.execute(
+                    "SELECT lat, lng, name || ', ' || country FROM places "
+                    "WHERE name = ? COLLATE NOCASE ORDER BY population DESC LIMIT 1",
+                    (name,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("Gazetteer lookup in %s failed: %s", self.path, e)
+            return None
+
+
+def build_gazetteer(source: str, path: str) -> int:
+    """
+    Build a gazetteer database from a GeoNames dump (e.g. cities5000.txt).
+
+    Both the local and the ASCII spelling of each place are indexed.
+
+    Args:
+        source: GeoNames tab-separated cities file
+        path: SQLite file to (re)create
+
+    Returns:
+        int: Number of names written
+    """
+    if os.path.exists(path):
+        os.remove(path)
+    conn = sqlite3.connect(path)
+    try:
+        with conn:
+            conn.execute(
+                "CREATE TABLE places (name TEXT NOT NULL, lat REAL NOT NULL, lng REAL NOT NULL, "
+                "country TEXT NOT NULL, population INTEGER NOT NULL)"
+            )
+            with open(source, encoding="utf-8", newline="") as f:
+                rows = []
+                for row in csv.reader(f, delimiter="\t", quoting=csv.QUOTE_NONE):
+                    for name in {row[_NAME], row[_ASCII_NAME]}:
+                        rows.append((name, float(row[_LAT]), float(row[_LNG]), row[_COUNTRY], int(row[_POPULATION] or 0)))
+            conn.executemany("INSERT INTO places VALUES (?, ?, ?, ?, ?)", rows)
+            conn.execute("CREATE INDEX places_name ON places (name COLLATE NOCASE)")
+    finally:
+        conn.close()
+    return len(rows)
+
+
+if __name__ == "__main__":
+    # python -m tools.gazetteer cities5000.txt /path/to/gazetteer.sqlite3
+    count = build_gazetteer(sys.argv[1], sys.argv[2])
+    print(f"Wrote {count} names to {sys.argv[2]}")
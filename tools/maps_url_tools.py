@@ -1,6 +1,36 @@
-from typing import List, Dict
+from functools import lru_cache, partial
+from typing import List, Dict, Optional, Tuple
 from urllib.parse import quote
 
+# Maps URL locations are path segments, so '/' in a name must be escaped too
+_quote_segment = partial(quote, safe='')
+
+
+@lru_cache(maxsize=256)
+def _maps_url(
+    origin: str,
+    destination: str,
+    waypoints: Optional[Tuple[str, ...]],
+    travel_mode: str
+) -> str:
+    """Build (and memoize) the Google Maps directions URL for a route."""
+    base_url = "https://www.google.com/maps/dir/"
+
+    # URL encode locations, each one is a single path segment
+    encoded_origin = _quote_segment(origin)
+    encoded_destination = _quote_segment(destination)
+
+    # Build URL with waypoints
+    if waypoints:
+        encoded_waypoints = "/".join(map(_quote_segment, waypoints))
+        url = f"{base_url}{encoded_origin}/{encoded_waypoints}/{encoded_destination}"
+    else:
+        url = f"{base_url}{encoded_origin}/{encoded_destination}"
+
+    # Add travel mode parameter
+    return url + f"/@?travelmode={travel_mode}"
+
+
 def generate_google_maps_url(
     origin: str,
     destination: str,
@@ -9,37 +39,30 @@ def generate_google_maps_url(
 ) -> Dict:
     """
     Generate a Google Maps URL to view the route.
-    
+
     Args:
         origin: Starting location
         destination: Ending location
         waypoints: Optional list of waypoints
         travel_mode: driving, walking, bicycling, or transit
-        
+
     Returns:
         dict: Contains the Google Maps URL
     """
-    base_url = "https://www.google.com/maps/dir/"
-    
-    # URL encode locations
-    encoded_origin = quote(origin)
-    encoded_destination = quote(destination)
-    
-    # Build URL with waypoints
-    if waypoints:
-        encoded_waypoints = "/".join([quote(wp) for wp in waypoints])
-        url = f"{base_url}{encoded_origin}/{encoded_waypoints}/{encoded_destination}"
-    else:
-        url = f"{base_url}{encoded_origin}/{encoded_destination}"
-    
-    # Add travel mode parameter
-    url += f"/@?travelmode={travel_mode}"
-    
-    return {
-        "status": "success",
-        "maps_url": url,
-        "message": f"Click here to view route in Google Maps: {url}"
-    }
+    try:
+        url = _maps_url(origin, destination, tuple(waypoints) if waypoints else None, travel_mode)
+
+        return {
+            "status": "success",
+            "maps_url": url,
+            "message": f"Click here to view route in Google Maps: {url}"
+        }
+
+    except Exception as e:
+        return {
+            "status": "error",
+            "error_message": str(e)
+        }
 
 
 def generate_maps_url_from_coordinates(
@@ -1,11 +1,24 @@
-import os
-import requests
-from typing import Dict, List, Tuple
-import math
+import orjson
+from functools import lru_cache
+from math import cos, radians
+from typing import Dict, Tuple
+from config import get_settings
+from tools._http import api_get
+
+
+@lru_cache(maxsize=1024)
+def _bbox_offsets(lat_rounded: float, radius_km: float) -> Tuple[float, float]:
+    """
+    Half-height and half-width in degrees of a radius_km bounding box.
+
+    Latitude is rounded to 2 decimals (~1km) by the caller, which
+    barely moves cos(lat), so searches around the same neighbourhood
+    reuse the result.
+    """
+    lat_offset = radius_km / 111  # Rough conversion
+    lng_offset = radius_km / (111 * abs(cos(radians(lat_rounded))))
+    return lat_offset, lng_offset
 
-STRAVA_TOKEN = os.getenv("STRAVA_ACCESS_TOKEN")
-HIKING_PROJECT_KEY = os.getenv("HIKING_PROJECT_API_KEY")
-MAPBOX_TOKEN = os.getenv("MAPBOX_ACCESS_TOKEN")
 
 def get_popular_running_routes_strava(
     lat: float,
@@ -18,8 +31,7 @@ def get_popular_running_routes_strava(
     Returns actual routes that real runners use!
     """
     # Create bounding box
-    lat_offset = radius_km / 111  # Rough conversion
-    lng_offset = radius_km / (111 * abs(math.cos(math.radians(lat))))
+    lat_offset, lng_offset = _bbox_offsets(round(lat, 2), radius_km)
     
     bounds = (
         lat - lat_offset,  # SW lat
@@ -30,15 +42,15 @@ def get_popular_running_routes_strava(
     
     url = "https://www.strava.com/api/v3/segments/explore"
     
-    headers = {"Authorization": f"Bearer {STRAVA_TOKEN}"}
+    headers = {"Authorization": f"Bearer {get_settings().strava_access_token}"}
     params = {
         "bounds": f"{bounds[0]},{bounds[1]},{bounds[2]},{bounds[3]}",
         "activity_type": "running"
     }
     
     try:
-        response = requests.get(url, headers=headers, params=params)
-        data = response.json()
+        response = api_get(url, params=params, headers=headers)
+        data = orjson.loads(response.content)
         
         if 'segments' in data:
             routes = []
@@ -88,12 +100,12 @@ def get_trail_running_routes(
         "lon": lng,
         "maxDistance": max_distance,
         "maxResults": 10,
-        "key": HIKING_PROJECT_KEY
+        "key": get_settings().hiking_project_api_key
     }
     
     try:
-        response = requests.get(url, params=params)
-        data = response.json()
+        response = api_get(url, params=params)
+        data = orjson.loads(response.content)
         
         if 'trails' in data:
             routes = []
@@ -146,12 +158,12 @@ def get_best_running_route(
         "geometries": "geojson",
         "steps": "true",
         "banner_instructions": "true",
-        "access_token": MAPBOX_TOKEN
+        "access_token": get_settings().mapbox_access_token
     }
     
     try:
-        response = requests.get(url, params=params)
-        data = response.json()
+        response = api_get(url, params=params)
+        data = orjson.loads(response.content)
         
         if 'routes' in data and len(data['routes']) > 0:
             route = data['routes'][0]
@@ -174,4 +186,4 @@ def get_best_running_route(
         return {
             "status": "error",
             "error_message": str(e)
-        }
\ No newline at end of file
+        }